@@ -1,9 +1,17 @@
 """
 Application Configuration
 """
+import logging
 import os
 from typing import Optional
 
+
+def _log_level(value: str) -> str:
+    """Return value as a logging level name, or INFO if logging doesn't know it."""
+    level = value.strip().upper()
+    return level if level in logging.getLevelNamesMapping() else 'INFO'
+
+
 class Config:
     # AWS Configuration
     AWS_REGION: str = os.getenv('AWS_REGION', 'eu-north-1')
@@ -44,6 +52,18 @@ class Config:
     
     # Password Requirements
     MIN_PASSWORD_LENGTH: int = 4
+
+    # Logging
+    # Unknown values fall back to INFO rather than failing Lambda INIT
+    LOG_LEVEL: str = _log_level(os.getenv('LOG_LEVEL', 'INFO'))
+
+    # App Settings
+    # Load the app_settings cache at import (Lambda INIT) instead of on the first request
+    WARM_SETTINGS_ON_IMPORT: bool = os.getenv('WARM_SETTINGS_ON_IMPORT', '1') == '1'
+
+    # Schemas
+    # Drop SchemaField descriptions (docs only, never used to validate) at import
+    SCHEMAS_STRIP_DOCS: bool = os.getenv('SCHEMAS_STRIP_DOCS', '0') == '1'
     
     # Email/SMS (for future use)
     EMAIL_FROM: Optional[str] = os.getenv('EMAIL_FROM')
@@ -2,7 +2,9 @@
 Login Handler
 """
 import json
-from datetime import datetime
+import logging
+import time
+from datetime import datetime, timezone
 from decimal import Decimal
 from config import config
 from config.otp import OTPType, EMAIL_OTP_TYPES
@@ -23,12 +25,25 @@ from utils import (
     check_resend_cooldown,
     login_success_response,
     error_response,
-    get_setting,
+    AppSettingsDB,
+    run_in_background,
 )
-from utils.schema_validator import validate_request_body
+from utils.schema_validator import validate_request_body, get_request_body
 from utils.schemas import login_schema
 from middleware import login_rate_limit
 
+logger = logging.getLogger(__name__)
+
+# Valid bcrypt hash (cost 12, same as gensalt() default) checked against when
+# no user matches, so unknown contacts take as long as a wrong password and
+# response timing does not reveal which accounts exist.
+_DUMMY_PASSWORD_HASH = '$2b$12$UZyMa8492c4DPKZswkb0suPnRouykxgqtVVdALiRhSmX4ImqFywze'
+
+
+def _invalid_credentials():
+    """The one 401 for unknown contacts and wrong passwords alike, so the body does not reveal which."""
+    return error_response("Invalid credentials", status_code=401)
+
 
 def _try_resend_otp(user_id: str, otp_type: str, contact: str) -> tuple[bool, str]:
     """
@@ -62,7 +77,7 @@ def login(event, context):
     Login with email or phone + password.
     """
     try:
-        body = json.loads(event.get('body', '{}'))
+        body = get_request_body(event)
         ip_address = event.get('requestContext', {}).get('identity', {}).get('sourceIp', 'unknown')
 
         raw_email = body.get('email', '').lower().strip() if body.get('email') else None
@@ -84,13 +99,17 @@ def login(event, context):
             login_contact = raw_phone
 
         if not user:
+            # Mirror the wrong-password path: one bcrypt check and one
+            # synchronous DynamoDB write (its counter UpdateItem) before answering
+            verify_password(password, _DUMMY_PASSWORD_HASH)
             LoginAttemptDB.record_attempt(ip_address, login_contact or '', success=False)
-            return error_response("Invalid credentials", status_code=401)
+            return _invalid_credentials()
 
-        # Settings
-        max_failed = get_setting('max_failed_login_attempts', 5)
-        lockout_minutes = get_setting('account_lockout_duration_minutes', 30)
-        require_verification = get_setting('require_otp_on_registration', True)
+        # Settings — one snapshot instead of a cache check per key
+        settings = AppSettingsDB.get_all_settings()
+        max_failed = settings.get('max_failed_login_attempts', 5)
+        lockout_minutes = settings.get('account_lockout_duration_minutes', 30)
+        require_verification = settings.get('require_otp_on_registration', True)
 
         # Auto-unlock check
         if user.get('is_locked', False):
@@ -149,9 +168,13 @@ def login(event, context):
 
         # Password check
         if not verify_password(password, user['password']):
-            failed = UserDB.increment_failed_attempts(user['user_id'])
-            if failed >= max_failed:
-                UserDB.lock_account(user['user_id'])
+            attempts = UserDB.increment_failed_attempts_and_lock(user['user_id'], max_failed)
+            if attempts is None:
+                # Deleted since it was cached — answer as for an unknown contact
+                LoginAttemptDB.record_attempt_async(ip_address, login_contact, success=False)
+                return _invalid_credentials()
+            _, locked = attempts
+            if locked:
                 msg = (
                     f"Account permanently locked after {max_failed} failed attempts. Contact support."
                     if lockout_minutes == 0
@@ -159,27 +182,36 @@ def login(event, context):
                 )
                 return error_response(msg, status_code=403)
 
-            LoginAttemptDB.record_attempt(ip_address, login_contact, success=False)
-            remaining = max_failed - failed
-            return error_response(
-                f"Invalid credentials. {remaining} attempt{'s' if remaining != 1 else ''} remaining.",
-                status_code=401,
-            )
+            LoginAttemptDB.record_attempt_async(ip_address, login_contact, success=False)
+            return _invalid_credentials()
 
-        # Successful login
-        UserDB.reset_failed_attempts(user['user_id'])
-        LoginAttemptDB.record_attempt(ip_address, login_contact, success=True)
+        # Successful login — the counter reset and the refresh token write are
+        # independent, so they run concurrently. If the reset fails, the
+        # stored token was never sent to the client and is deleted; a user
+        # deleted since it was cached gets no session.
+        reset_future = run_in_background(UserDB.reset_failed_attempts, user['user_id'])
 
         access_token = generate_access_token(user['user_id'], user.get('email', ''), user['role'])
         refresh_token = generate_refresh_token(user['user_id'])
 
-        expires_at = int(datetime.utcnow().timestamp() + config.REFRESH_TOKEN_EXPIRY)
+        now = time.time()
+        expires_at = int(now) + config.REFRESH_TOKEN_EXPIRY
         RefreshTokenDB.create_token({
             'token':      refresh_token,
             'user_id':    user['user_id'],
-            'created_at': datetime.utcnow().isoformat(),
-            'expires_at': Decimal(str(expires_at)),
+            'created_at': datetime.fromtimestamp(now, timezone.utc).replace(tzinfo=None).isoformat(),
+            'expires_at': Decimal(expires_at),
         })
+        try:
+            user_exists = reset_future.result()
+        except Exception:
+            RefreshTokenDB.delete_token(refresh_token)
+            raise
+        if not user_exists:
+            RefreshTokenDB.delete_token(refresh_token)
+            LoginAttemptDB.record_attempt_async(ip_address, login_contact, success=False)
+            return _invalid_credentials()
+        LoginAttemptDB.record_attempt_async(ip_address, login_contact, success=True)
 
         return login_success_response(
             user=user,
@@ -191,5 +223,5 @@ def login(event, context):
     except json.JSONDecodeError:
         return error_response("Invalid JSON in request body")
     except Exception as e:
-        print(f"Login error: {str(e)}")
+        logger.error("Login error: %s", e, exc_info=True)
         return error_response("Login failed", status_code=500)
@@ -7,7 +7,7 @@ from utils import (
     success_response,
     error_response
 )
-from utils.schema_validator import validate_request_body
+from utils.schema_validator import validate_request_body, get_request_body
 from utils.schemas import logout_schema
 from middleware import require_auth
 
@@ -19,7 +19,7 @@ def logout(event, context):
     Logout user (revoke refresh token)
     """
     try:
-        body = json.loads(event.get('body', '{}'))
+        body = get_request_body(event)
         
         refresh_token = body.get('refresh_token')
         
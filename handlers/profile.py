@@ -21,7 +21,7 @@ from utils import (
     error_response,
     validation_error_response,
 )
-from utils.schema_validator import validate_request_body
+from utils.schema_validator import validate_request_body, get_request_body
 from utils.schemas import update_profile_schema
 from middleware import require_auth, get_current_user
 
@@ -73,7 +73,7 @@ def update_me(event, context):
     """
     try:
         current_user = get_current_user(event)
-        body = json.loads(event.get('body', '{}'))
+        body = get_request_body(event)
 
         user = UserDB.get_user_by_id(current_user['user_id'])
         if not user:
@@ -14,7 +14,7 @@ from utils import (
     error_response,
     unauthorized_response
 )
-from utils.schema_validator import validate_request_body
+from utils.schema_validator import validate_request_body, get_request_body
 from utils.schemas import refresh_token_schema
 
 @validate_request_body(refresh_token_schema)
@@ -24,7 +24,7 @@ def refresh(event, context):
     Refresh access token using refresh token
     """
     try:
-        body = json.loads(event.get('body', '{}'))
+        body = get_request_body(event)
         
         refresh_token = body.get('refresh_token')
         
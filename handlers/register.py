@@ -21,7 +21,7 @@ from utils import (
     error_response,
     get_setting
 )
-from utils.schema_validator import validate_request_body
+from utils.schema_validator import validate_request_body, get_request_body
 from utils.schemas import registration_schema, master_registration_schema
 from utils.validators import validate_email, validate_phone
 from middleware import register_rate_limit
@@ -48,7 +48,7 @@ def register(event, context):
         if not allow_public_signup:
             return error_response("Public signup is currently disabled", status_code=403)
 
-        body = json.loads(event.get('body', '{}'))
+        body = get_request_body(event)
 
         email = body.get('email', '').lower().strip() or None
         phone = normalize_phone(body.get('phone', '').strip()) if body.get('phone') else None
@@ -150,7 +150,7 @@ def register_master(event, context):
     Register a master user (requires secret key).
     """
     try:
-        body = json.loads(event.get('body', '{}'))
+        body = get_request_body(event)
 
         if not config.MASTER_SECRET_KEY:
             return error_response("Master registration is not configured", status_code=500)
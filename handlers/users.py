@@ -17,7 +17,7 @@ from utils import (
     validation_error_response,
     get_setting
 )
-from utils.schema_validator import validate_request_body
+from utils.schema_validator import validate_request_body, get_request_body
 from utils.schemas import create_user_schema, update_role_schema
 from middleware import require_auth, get_current_user
 
@@ -143,7 +143,7 @@ def update_user_role(event, context):
 
         current_user = get_current_user(event)
         user_id = event['pathParameters']['id']
-        body = json.loads(event.get('body', '{}'))
+        body = get_request_body(event)
 
         new_role = body.get('role')
 
@@ -270,7 +270,7 @@ def create_internal_user(event, context):
             return error_response("Adding new users is currently disabled", status_code=403)
 
         current_user = get_current_user(event)
-        body = json.loads(event.get('body', '{}'))
+        body = get_request_body(event)
 
         # Validate basic registration data
         is_valid, errors = validate_registration_data(body)
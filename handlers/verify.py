@@ -17,7 +17,7 @@ from utils import (
     success_response,
     error_response,
 )
-from utils.schema_validator import validate_request_body
+from utils.schema_validator import validate_request_body, get_request_body
 from utils.schemas import verification_schema, resend_otp_schema
 from utils.validators import validate_email
 
@@ -29,7 +29,7 @@ def verify(event, context):
     Verify an OTP code for any supported OTP type.
     """
     try:
-        body = json.loads(event.get('body', '{}'))
+        body = get_request_body(event)
         user_id = body['user_id']
         code    = body['code']
         otp_type = body['otp_type']
@@ -123,7 +123,7 @@ def resend_otp(event, context):
     Resend an OTP (public endpoint — user may not be authenticated yet).
     """
     try:
-        body = json.loads(event.get('body', '{}'))
+        body = get_request_body(event)
         user_id  = body['user_id']
         otp_type = body['otp_type']
 
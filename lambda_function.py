@@ -2,11 +2,21 @@
 Main Lambda Handler with Internal Routing
 """
 import json
+import logging
 import os
 import re
 from typing import Dict, Any, Optional, Tuple
 import bcrypt
 import traceback
+from decimal import Decimal
+
+from config import config
+
+# Configure logging before the handler imports below, which log during INIT.
+# Lambda installs its own root handler (basicConfig is then a no-op) at WARNING,
+# so the level is set explicitly.
+logging.basicConfig(level=config.LOG_LEVEL)
+logging.getLogger().setLevel(config.LOG_LEVEL)
 
 # Import handlers
 from handlers import (
@@ -37,6 +47,24 @@ from handlers.permissions import (
 )
 from utils import error_response
 
+def _json_default(obj: Any) -> Any:
+    """DynamoDB numbers arrive as Decimal — send them as JSON numbers, not strings."""
+    if isinstance(obj, Decimal):
+        return int(obj) if obj == obj.to_integral_value() else float(obj)
+    return str(obj)
+
+
+# orjson serializes response bodies several times faster than stdlib json;
+# fall back to json when it is not installed (e.g. local development).
+try:
+    import orjson
+
+    def dumps_body(obj: Any) -> str:
+        return orjson.dumps(obj, default=_json_default).decode()
+except ImportError:
+    def dumps_body(obj: Any) -> str:
+        return json.dumps(obj, default=_json_default)
+
 # Load environment variables from .env if running locally
 try:
     from dotenv import load_dotenv
@@ -53,31 +81,94 @@ except Exception as e:
     print(f"[WARNING] Could not initialize app settings: {str(e)}")
     # Continue execution - settings will use defaults if initialization fails
 
-# Route mapping
+# Response headers — built once and shared by every response
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "*",
+    "Access-Control-Allow-Methods": "OPTIONS,GET,POST,PUT,PATCH,DELETE",
+}
+JSON_HEADERS = {"Content-Type": "application/json", **CORS_HEADERS}
+
+# Route mapping: method → path template → handler, the same shape as
+# utils.schemas.ROUTE_SCHEMAS. A lookup hashes only the path, and a method
+# with no routes is rejected before any path work.
 ROUTES = {
-    'POST /auth/register': register,
-    'POST /auth/register-master': register_master,
-    'POST /auth/verify': verify,
-    'POST /auth/resend-otp': resend_otp,
-    'POST /auth/login': login,
-    'POST /auth/refresh': refresh,
-    'POST /auth/logout': logout,
-    'GET /auth/me': get_me,
-    'PUT /auth/me': update_me,
-    'GET /users': list_users,
-    'POST /users': create_internal_user,
-    'GET /users/{id}': get_user,
-    'PUT /users/{id}/role': update_user_role,
-    'DELETE /users/{id}': delete_user,
-    'GET /settings':                         get_settings,
-    'PUT /settings':                         update_settings,
-    'GET /permissions':                      get_all_permissions,
-    'GET /permissions/{resource}':           get_resource_permissions,
-    'PUT /permissions/{resource}':           update_resource_permissions,
-    'POST /permissions/seed':                seed_permissions,
+    'GET': {
+        '/auth/me':                         get_me,
+        '/users':                           list_users,
+        '/users/{id}':                      get_user,
+        '/settings':                        get_settings,
+        '/permissions':                     get_all_permissions,
+        '/permissions/{resource}':          get_resource_permissions,
+    },
+    'POST': {
+        '/auth/register':                   register,
+        '/auth/register-master':            register_master,
+        '/auth/verify':                     verify,
+        '/auth/resend-otp':                 resend_otp,
+        '/auth/login':                      login,
+        '/auth/refresh':                    refresh,
+        '/auth/logout':                     logout,
+        '/users':                           create_internal_user,
+        '/permissions/seed':                seed_permissions,
+    },
+    'PUT': {
+        '/auth/me':                         update_me,
+        '/users/{id}/role':                 update_user_role,
+        '/settings':                        update_settings,
+        '/permissions/{resource}':          update_resource_permissions,
+    },
+    'DELETE': {
+        '/users/{id}':                      delete_user,
+    },
 }
 
 
+# Templated paths compiled once at import into a per-method trie of path
+# segments: static segments are dict keys, a {param} segment is the _PARAM
+# child, and the (handler, param names) pair sits under _LEAF where the
+# template ends. Exact paths are served straight from ROUTES.
+_PARAM = object()
+_LEAF = object()
+_ROUTE_TRIE: Dict[str, Dict[Any, Any]] = {}
+
+for _method, _routes in ROUTES.items():
+    for _path, _handler in _routes.items():
+        if '{' not in _path:
+            continue
+        _node = _ROUTE_TRIE.setdefault(_method, {})
+        _names = []
+        for _segment in _path.split('/'):
+            _param = re.fullmatch(r'\{(\w+)\}', _segment)
+            if _param:
+                _names.append(_param.group(1))
+            _node = _node.setdefault(_PARAM if _param else _segment, {})
+        # First template wins on a duplicate, as in ROUTES order
+        _node.setdefault(_LEAF, (_handler, tuple(_names)))
+
+_NO_ROUTES: Dict[str, Any] = {}
+
+
+def _walk_route_trie(node: Dict[Any, Any], segments: list, index: int, values: list):
+    """Depth-first match preferring static segments; returns (handler, names) or None."""
+    if index == len(segments):
+        return node.get(_LEAF)
+    segment = segments[index]
+    child = node.get(segment)
+    if child is not None:
+        found = _walk_route_trie(child, segments, index + 1, values)
+        if found is not None:
+            return found
+    child = node.get(_PARAM)
+    if child is not None and segment:
+        values.append(segment)
+        found = _walk_route_trie(child, segments, index + 1, values)
+        if found is not None:
+            return found
+        values.pop()
+    return None
+
+
 def match_route(http_method: str, path: str) -> Optional[Tuple[Any, Dict[str, str]]]:
     """
     Match incoming request to a route pattern and extract path parameters
@@ -89,27 +180,20 @@ def match_route(http_method: str, path: str) -> Optional[Tuple[Any, Dict[str, st
     Returns:
         Tuple of (handler_function, path_parameters) or None if no match
     """
-    for route_pattern, handler in ROUTES.items():
-        # Split route pattern into method and path
-        pattern_method, pattern_path = route_pattern.split(' ', 1)
-
-        # Check if method matches
-        if pattern_method != http_method:
-            continue
+    handler = ROUTES.get(http_method, _NO_ROUTES).get(path)
+    # A template key hit literally (e.g. '/users/{id}') still needs its params
+    if handler is not None and '{' not in path:
+        return handler, {}
 
-        # Convert route pattern to regex
-        # Replace {param} with named capture groups
-        regex_pattern = re.sub(r'\{(\w+)\}', r'(?P<\1>[^/]+)', pattern_path)
-        regex_pattern = f'^{regex_pattern}$'
-
-        # Try to match the path
-        match = re.match(regex_pattern, path)
-        if match:
-            # Extract path parameters
-            path_params = match.groupdict()
-            return handler, path_params
-
-    return None
+    trie = _ROUTE_TRIE.get(http_method)
+    if trie is None:
+        return None
+    values: list = []
+    found = _walk_route_trie(trie, path.split('/'), 0, values)
+    if found is None:
+        return None
+    handler, names = found
+    return handler, dict(zip(names, values))
 
 
 def lambda_handler(event: Dict[str, Any], context):
@@ -131,11 +215,7 @@ def lambda_handler(event: Dict[str, Any], context):
         if http_method == "OPTIONS":
             return {
                 "statusCode": 200,
-                "headers": {
-                    "Access-Control-Allow-Origin": "*",
-                    "Access-Control-Allow-Headers": "*",
-                    "Access-Control-Allow-Methods": "OPTIONS,GET,POST,PUT,PATCH,DELETE",
-                },
+                "headers": CORS_HEADERS,
             }
 
         # Parse body safely
@@ -176,25 +256,15 @@ def lambda_handler(event: Dict[str, Any], context):
 
             return {
                 "statusCode": status_code,
-                "headers": {
-                    "Content-Type": "application/json",
-                    "Access-Control-Allow-Origin": "*",
-                    "Access-Control-Allow-Headers": "*",
-                    "Access-Control-Allow-Methods": "OPTIONS,GET,POST,PUT,PATCH,DELETE"
-                },
-                "body": json.dumps(response_body)
+                "headers": JSON_HEADERS,
+                "body": dumps_body(response_body)
             }
         else:
             print(f"No handler found for route: {route_key}")
             return {
                 "statusCode": 404,
-                "headers": {
-                    "Content-Type": "application/json",
-                    "Access-Control-Allow-Origin": "*",
-                    "Access-Control-Allow-Headers": "*",
-                    "Access-Control-Allow-Methods": "OPTIONS,GET,POST,PUT,PATCH,DELETE"
-                },
-                "body": json.dumps({
+                "headers": JSON_HEADERS,
+                "body": dumps_body({
                     "success": False,
                     "message": "Route not found",
                     "data": None,
@@ -213,13 +283,8 @@ def lambda_handler(event: Dict[str, Any], context):
         traceback.print_exc()
         return {
             "statusCode": 500,
-            "headers": {
-                "Content-Type": "application/json",
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Headers": "*",
-                "Access-Control-Allow-Methods": "OPTIONS,GET,POST,PUT,PATCH,DELETE"
-            },
-            "body": json.dumps({
+            "headers": JSON_HEADERS,
+            "body": dumps_body({
                 "success": False,
                 "message": "Internal server error",
                 "data": None,
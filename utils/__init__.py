@@ -3,7 +3,8 @@ from .database import (
     RefreshTokenDB,
     VerificationCodeDB,
     LoginAttemptDB,
-    RateLimitDB
+    RateLimitDB,
+    run_in_background,
 )
 from .app_settings import AppSettingsDB, get_setting
 from .jwt_utils import (
@@ -73,6 +74,7 @@ __all__ = [
     'VerificationCodeDB',
     'LoginAttemptDB',
     'RateLimitDB',
+    'run_in_background',
     'AppSettingsDB',
     'get_setting',
     # JWT
@@ -12,12 +12,16 @@ Permission design: secure by default.
   Only master bypasses all permission checks.
 """
 import boto3
+import logging
 import time
 from datetime import datetime
 from decimal import Decimal
 from typing import Any, Dict, Optional
 from boto3.dynamodb.conditions import Attr
 from config import config
+from .schema_validator import clear_validation_cache
+
+logger = logging.getLogger(__name__)
 
 # DynamoDB client
 dynamodb = boto3.resource('dynamodb')
@@ -27,6 +31,11 @@ settings_table = dynamodb.Table(config.APP_SETTINGS_TABLE)
 # DynamoDB edits propagate to all warm Lambda containers automatically.
 _CACHE_TTL = 60  # seconds
 
+# BatchGetItem may return UnprocessedKeys under throttling — retry this many
+# times, backing off exponentially (50 ms, 100 ms, ...) between attempts
+_BATCH_GET_MAX_ATTEMPTS = 3
+_BATCH_GET_BACKOFF = 0.05  # seconds
+
 # ── General settings cache ────────────────────────────────────────────────
 _settings_cache: Dict[str, Any] = {}
 _settings_cache_expires_at: float = 0.0
@@ -51,19 +60,6 @@ DEFAULT_SETTINGS = {
 }
 
 
-# ═══════════════════════════════════════════════════════════════════════════
-# Helpers
-# ═══════════════════════════════════════════════════════════════════════════
-
-def _convert_dynamodb_types(value: Any) -> Any:
-    """Convert DynamoDB Decimal types to native Python types."""
-    if isinstance(value, Decimal):
-        if value % 1 == 0:
-            return int(value)
-        return float(value)
-    return value
-
-
 # ═══════════════════════════════════════════════════════════════════════════
 # General Settings
 # ═══════════════════════════════════════════════════════════════════════════
@@ -77,20 +73,21 @@ def initialize_settings():
     try:
         response = settings_table.get_item(Key={'setting_key': '_initialized'})
         if 'Item' in response:
-            print("[INFO] Settings already initialized")
+            logger.info("Settings already initialized")
             return
 
-        print("[INFO] Initializing default settings...")
-        for key, value in DEFAULT_SETTINGS.items():
-            settings_table.put_item(Item={
-                'setting_key':   key,
-                'setting_value': value,
-                'setting_type':  type(value).__name__,
-            })
-        print("[INFO] Default settings initialized successfully")
+        logger.info("Initializing default settings...")
+        with settings_table.batch_writer() as batch:
+            for key, value in DEFAULT_SETTINGS.items():
+                batch.put_item(Item={
+                    'setting_key':   key,
+                    'setting_value': value,
+                    'setting_type':  type(value).__name__,
+                })
+        logger.info("Default settings initialized successfully")
 
     except Exception as e:
-        print(f"[ERROR] Failed to initialize settings: {e}")
+        logger.error("Failed to initialize settings: %s", e)
         raise
 
 
@@ -99,28 +96,52 @@ def _settings_cache_expired() -> bool:
 
 
 def load_settings() -> Dict[str, Any]:
-    """Load all general settings from DynamoDB into cache and reset TTL."""
+    """
+    Load all general settings from DynamoDB into cache and reset TTL.
+
+    The key set is fixed (DEFAULT_SETTINGS), so a BatchGetItem of those keys
+    replaces a full table Scan — which would also read every
+    resource_permission:* record. Keys missing from the table fall back to
+    their defaults so the cache is always complete.
+    """
     global _settings_cache, _settings_cache_expires_at
 
     try:
-        response = settings_table.scan()
-        items = response.get('Items', [])
-        while 'LastEvaluatedKey' in response:
-            response = settings_table.scan(ExclusiveStartKey=response['LastEvaluatedKey'])
-            items.extend(response.get('Items', []))
-
-        _settings_cache = {}
-        for item in items:
-            key   = item['setting_key']
-            value = _convert_dynamodb_types(item['setting_value'])
-            _settings_cache[key] = value
+        items = []
+        request = {config.APP_SETTINGS_TABLE: {
+            'Keys': [{'setting_key': key} for key in DEFAULT_SETTINGS],
+        }}
+        for attempt in range(_BATCH_GET_MAX_ATTEMPTS):
+            if attempt:
+                time.sleep(_BATCH_GET_BACKOFF * 2 ** (attempt - 1))
+            response = dynamodb.batch_get_item(RequestItems=request)
+            items.extend(response.get('Responses', {}).get(config.APP_SETTINGS_TABLE, []))
+            request = response.get('UnprocessedKeys')
+            if not request:
+                break
+        else:
+            logger.warning("Some settings were not returned by DynamoDB; using defaults for them")
+
+        # The boto3 resource already deserializes items; only numbers need
+        # converting, from Decimal back to int/float.
+        _settings_cache = {
+            **DEFAULT_SETTINGS,
+            **{
+                item['setting_key']: (
+                    (int(value) if value % 1 == 0 else float(value))
+                    if isinstance(value := item['setting_value'], Decimal) else value
+                )
+                for item in items
+            },
+        }
 
         _settings_cache_expires_at = time.time() + _CACHE_TTL
-        print(f"[INFO] Loaded {len(_settings_cache)} settings into cache (TTL {_CACHE_TTL}s)")
+        clear_validation_cache()
+        logger.info("Loaded %d settings into cache (TTL %ds)", len(_settings_cache), _CACHE_TTL)
         return _settings_cache
 
     except Exception as e:
-        print(f"[ERROR] Failed to load settings: {e}")
+        logger.error("Failed to load settings: %s", e)
         return DEFAULT_SETTINGS.copy()
 
 
@@ -146,19 +167,33 @@ def update_setting(key: str, value: Any) -> None:
         'setting_type':  type(value).__name__,
     })
     _settings_cache[key] = value
-    print(f"[INFO] Updated setting: {key} = {value}")
+    clear_validation_cache()
+    logger.info("Updated setting: %s = %s", key, value)
 
 
 def update_settings(settings: Dict[str, Any]) -> None:
-    for key, value in settings.items():
-        update_setting(key, value)
+    """
+    Write several settings at once. batch_writer packs up to 25 puts into
+    each BatchWriteItem call instead of one PutItem round-trip per key.
+    """
+    with settings_table.batch_writer() as batch:
+        for key, value in settings.items():
+            batch.put_item(Item={
+                'setting_key':   key,
+                'setting_value': value,
+                'setting_type':  type(value).__name__,
+            })
+    _settings_cache.update(settings)
+    clear_validation_cache()
+    logger.info("Updated %d setting(s): %s", len(settings), ', '.join(settings))
 
 
 def clear_cache():
     """Force-expire the general settings cache so the next read hits DynamoDB."""
     global _settings_cache_expires_at
     _settings_cache_expires_at = 0.0
-    print("[INFO] Settings cache expired")
+    clear_validation_cache()
+    logger.info("Settings cache expired")
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -186,7 +221,7 @@ def get_resource_config(resource: str) -> Optional[dict]:
         _resource_permission_cache_expires[cache_key] = time.time() + _CACHE_TTL
         return value
     except Exception as e:
-        print(f"[ERROR] Failed to get resource config for '{resource}': {e}")
+        logger.error("Failed to get resource config for '%s': %s", resource, e)
         return None  # fail closed
 
 
@@ -217,7 +252,7 @@ def set_resource_config(
                     'description':  existing_value.get('description'),
                 }
     except Exception as e:
-        print(f"[WARN] Could not fetch existing config for '{resource}': {e}")
+        logger.warning("Could not fetch existing config for '%s': %s", resource, e)
 
     now = datetime.utcnow().isoformat()
     record: dict = {
@@ -285,14 +320,14 @@ def seed_default_permissions() -> dict:
     for resource, operations in DEFAULT_RESOURCE_PERMISSIONS.items():
         set_resource_config(resource, operations)
         seeded.append(resource)
-        print(f"[INFO] Seeded permissions for resource: {resource}")
+        logger.info("Seeded permissions for resource: %s", resource)
     return {'seeded': seeded}
 
 
 def clear_resource_permission_cache() -> None:
     """Force-expire all resource permission cache entries so next reads hit DynamoDB."""
     _resource_permission_cache_expires.clear()
-    print("[INFO] Resource permission cache expired")
+    logger.info("Resource permission cache expired")
 
 
 def get_all_resource_configs() -> dict:
@@ -317,7 +352,7 @@ def get_all_resource_configs() -> dict:
             for item in items
         }
     except Exception as e:
-        print(f"[ERROR] Failed to get all resource configs: {e}")
+        logger.error("Failed to get all resource configs: %s", e)
         return {}
 
 
@@ -381,3 +416,11 @@ class AppSettingsDB:
     @staticmethod
     def get_all_resource_configs() -> dict:
         return get_all_resource_configs()
+
+
+# Warm the general settings cache during Lambda INIT so the first request on
+# a new container does not pay for the DynamoDB read. load_settings() never
+# raises; on failure the cache stays expired and the next read retries.
+# Set WARM_SETTINGS_ON_IMPORT=0 for scripts/tests that import without AWS.
+if config.WARM_SETTINGS_ON_IMPORT:
+    load_settings()
@@ -2,10 +2,16 @@
 DynamoDB Database Utilities
 """
 import boto3
+import logging
 from boto3.dynamodb.conditions import Key, Attr
-from typing import Optional, Dict, Any, List
+from botocore.exceptions import ClientError
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timedelta
 from config import config
+from .user_cache import UserCache
+
+logger = logging.getLogger(__name__)
 
 # Initialize DynamoDB
 dynamodb = boto3.resource('dynamodb', region_name=config.AWS_REGION)
@@ -17,6 +23,34 @@ verification_codes_table = dynamodb.Table(config.VERIFICATION_CODES_TABLE)
 login_attempts_table = dynamodb.Table(config.LOGIN_ATTEMPTS_TABLE)
 rate_limits_table = dynamodb.Table(config.RATE_LIMITS_TABLE)
 
+# Email lookups are cached briefly so login floods against one account share a read
+_user_cache = UserCache(maxsize=1024, ttl=5)
+
+# boto3 resources are not thread-safe, but their low-level client is. Work
+# submitted to the background pool goes through this one shared client
+# (typed attribute values) rather than the Table resources above.
+dynamodb_client = dynamodb.meta.client
+
+# Background writer for DynamoDB calls that can overlap with other request work
+_background_writer = ThreadPoolExecutor(max_workers=4, thread_name_prefix='ddb-bg')
+
+
+def run_in_background(fn, *args, **kwargs) -> Future:
+    """
+    Run a DynamoDB call on the shared background pool.
+    fn must use dynamodb_client, not the Table resources, which belong to
+    the request thread.
+    Call .result() on the returned Future before responding if the request
+    depends on the write; otherwise the write is best effort.
+    """
+    return _background_writer.submit(fn, *args, **kwargs)
+
+
+def _log_background_error(future: Future):
+    exc = future.exception()
+    if exc is not None:
+        logger.error("Background write error: %s", exc, exc_info=exc)
+
 
 class UserDB:
     """User table operations"""
@@ -29,13 +63,20 @@ class UserDB:
     
     @staticmethod
     def get_user_by_email(email: str) -> Optional[Dict[str, Any]]:
-        """Get user by email"""
+        """Get user by email (cached for a few seconds, see utils.user_cache)"""
+        user = _user_cache.get(email)
+        if user is not None:
+            return user
+
         response = users_table.query(
             IndexName='email-index',
             KeyConditionExpression=Key('email').eq(email)
         )
         items = response.get('Items', [])
-        return items[0] if items else None
+        if not items:
+            return None
+        _user_cache.put(email, items[0])
+        return items[0]
 
     @staticmethod
     def get_user_by_phone(phone: str) -> Optional[Dict[str, Any]]:
@@ -67,12 +108,14 @@ class UserDB:
             ExpressionAttributeValues=expr_attr_values,
             ReturnValues='ALL_NEW'
         )
+        _user_cache.invalidate(user_id)  # email itself may have changed
         return response.get('Attributes', {})
     
     @staticmethod
     def delete_user(user_id: str) -> bool:
         """Delete a user"""
         users_table.delete_item(Key={'user_id': user_id})
+        _user_cache.invalidate(user_id)
         return True
     
     @staticmethod
@@ -121,28 +164,100 @@ class UserDB:
             ExpressionAttributeValues={':inc': 1, ':zero': 0},
             ReturnValues='ALL_NEW'
         )
+        _user_cache.update(user_id, response['Attributes'])
         return response['Attributes']['failed_login_attempts']
     
     @staticmethod
-    def reset_failed_attempts(user_id: str):
-        """Reset failed login attempts"""
-        users_table.update_item(
-            Key={'user_id': user_id},
-            UpdateExpression='SET failed_login_attempts = :zero',
-            ExpressionAttributeValues={':zero': 0}
-        )
+    def increment_failed_attempts_and_lock(user_id: str, max_attempts: int) -> Optional[Tuple[int, bool]]:
+        """
+        Increment failed login attempts and lock the account once the count
+        reaches max_attempts. Returns (failed_attempts, is_locked), or None if
+        the user no longer exists (e.g. deleted while still cached here).
+
+        Below the threshold this is a single conditional UpdateItem; only the
+        attempt that triggers the lock needs a second write. Both run as
+        atomic updates, so concurrent failures cannot skip the lock, and both
+        require the item to exist so they never upsert a partial user.
+        """
+        if max_attempts > 1:
+            try:
+                response = users_table.update_item(
+                    Key={'user_id': user_id},
+                    UpdateExpression='SET failed_login_attempts = if_not_exists(failed_login_attempts, :zero) + :inc',
+                    ConditionExpression=(
+                        'attribute_exists(user_id) AND '
+                        '(attribute_not_exists(failed_login_attempts) OR failed_login_attempts < :lock_at)'
+                    ),
+                    ExpressionAttributeValues={':inc': 1, ':zero': 0, ':lock_at': max_attempts - 1},
+                    ReturnValues='UPDATED_NEW'
+                )
+                _user_cache.update(user_id, response['Attributes'])
+                return int(response['Attributes']['failed_login_attempts']), False
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                    raise
+
+        # This attempt reaches the threshold (or the user is gone) — increment
+        # and lock together
+        try:
+            response = users_table.update_item(
+                Key={'user_id': user_id},
+                UpdateExpression=(
+                    'SET failed_login_attempts = if_not_exists(failed_login_attempts, :zero) + :inc, '
+                    'is_locked = :locked, locked_at = :now'
+                ),
+                ConditionExpression='attribute_exists(user_id)',
+                ExpressionAttributeValues={
+                    ':inc': 1,
+                    ':zero': 0,
+                    ':locked': True,
+                    ':now': datetime.utcnow().isoformat()
+                },
+                ReturnValues='UPDATED_NEW'
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+            _user_cache.invalidate(user_id)
+            return None
+        _user_cache.update(user_id, response['Attributes'])
+        return int(response['Attributes']['failed_login_attempts']), True
+
+    @staticmethod
+    def reset_failed_attempts(user_id: str) -> bool:
+        """
+        Reset failed login attempts (safe to run on the background pool).
+        Returns False, without writing, if the user no longer exists.
+        """
+        try:
+            dynamodb_client.update_item(
+                TableName=config.USERS_TABLE,
+                Key={'user_id': {'S': user_id}},
+                UpdateExpression='SET failed_login_attempts = :zero',
+                ConditionExpression='attribute_exists(user_id)',
+                ExpressionAttributeValues={':zero': {'N': '0'}}
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+            _user_cache.invalidate(user_id)
+            return False
+        _user_cache.update(user_id, {'failed_login_attempts': 0})
+        return True
     
     @staticmethod
     def lock_account(user_id: str):
         """Lock user account"""
+        now = datetime.utcnow().isoformat()
         users_table.update_item(
             Key={'user_id': user_id},
             UpdateExpression='SET is_locked = :locked, locked_at = :now',
             ExpressionAttributeValues={
                 ':locked': True,
-                ':now': datetime.utcnow().isoformat()
+                ':now': now
             }
         )
+        _user_cache.update(user_id, {'is_locked': True, 'locked_at': now})
 
     @staticmethod
     def unlock_account(user_id: str):
@@ -155,6 +270,7 @@ class UserDB:
                 ':zero': 0
             }
         )
+        _user_cache.invalidate(user_id)
 
     @staticmethod
     def should_auto_unlock(user: Dict[str, Any], lockout_duration_minutes: int) -> bool:
@@ -274,13 +390,25 @@ class LoginAttemptDB:
     
     @staticmethod
     def record_attempt(ip_address: str, email: str, success: bool):
-        """Record a login attempt"""
-        login_attempts_table.put_item(Item={
-            'ip_address': ip_address,
-            'timestamp': datetime.utcnow().isoformat(),
-            'email': email,
-            'success': success
+        """Record a login attempt (safe to run on the background pool)"""
+        dynamodb_client.put_item(TableName=config.LOGIN_ATTEMPTS_TABLE, Item={
+            'ip_address': {'S': ip_address},
+            'timestamp': {'S': datetime.utcnow().isoformat()},
+            'email': {'S': email},
+            'success': {'BOOL': success}
         })
+
+    @staticmethod
+    def record_attempt_async(ip_address: str, email: str, success: bool) -> Future:
+        """
+        Record a login attempt without blocking the caller on the DynamoDB write.
+        Best effort: Lambda freezes the container after the response, so a write
+        still in flight finishes on the next invocation (or is lost on recycle).
+        Only use for audit records nothing reads back during the request.
+        """
+        future = run_in_background(LoginAttemptDB.record_attempt, ip_address, email, success)
+        future.add_done_callback(_log_background_error)
+        return future
     
     @staticmethod
     def count_recent_attempts(ip_address: str, hours: int = 1) -> int:
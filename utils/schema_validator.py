@@ -3,7 +3,14 @@ Schema-based request body validation.
 
 SchemaField  — declares a single field's rules.
 Schema       — collects fields, runs all checks, supports cross-field rules.
+StrictSchema — a Schema that always rejects unknown fields.
 @validate_request_body — decorator that validates before the handler runs.
+get_request_body — returns the body the decorator already parsed.
+
+Validation verdicts (pass, or the error) are memoized per schema for a short
+time, keyed by a digest of the raw body, so retries and bot floods resending
+the same payload skip re-validation. Only the digest is kept, never the body.
+The memo is cleared whenever app settings change or are reloaded.
 
 Custom validators
 -----------------
@@ -25,9 +32,15 @@ ValidationError if the combination of values is invalid.
 """
 
 from __future__ import annotations
+import hashlib
+import json
 import re
-from typing import Any, Callable, Dict, List, Optional, Union
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Collection, Dict, Iterable, List, Optional, Tuple, Union
 
+from config import config
 from utils.responses import error_response
 
 
@@ -36,12 +49,20 @@ from utils.responses import error_response
 # ---------------------------------------------------------------------------
 
 class ValidationError(Exception):
-    def __init__(self, message: str, details: Dict[str, Any] = None):
+    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         self.message = message
         self.details = details or {}
         super().__init__(self.message)
 
 
+# Sentinel for "key absent" in compiled validators (None is a real value)
+_MISSING = object()
+
+# JSON scalars decode to exactly these types, so type(v) is T is the whole
+# check: one pointer compare, and bool is rejected for int without a second test
+_EXACT_TYPES = frozenset({str, int, float, bool})
+
+
 # ---------------------------------------------------------------------------
 # SchemaField
 # ---------------------------------------------------------------------------
@@ -60,11 +81,19 @@ class SchemaField:
     min_value    : minimum numeric value
     max_value    : maximum numeric value
     allowed_values : field must be one of these values
-    pattern      : regex the string must fully match
+    pattern      : regex (str or compiled re.Pattern) the string must fully match
     custom_validator : callable(value) → (bool, str|None) or raises ValidationError
-    description  : human-readable description (used in docs / error messages)
+    description  : human-readable description (docs only; dropped when
+                   SCHEMAS_STRIP_DOCS=1)
     """
 
+    # Fixed layout: ~40 fields are declared at import and read on every request
+    __slots__ = (
+        'field_type', 'required', 'nullable', 'min_length', 'max_length',
+        'min_value', 'max_value', 'allowed_values', 'pattern', 'custom_validator',
+        'description', '_pattern_re', '_type_name', '_allowed_values_text', '_checks',
+    )
+
     def __init__(
         self,
         field_type: type,
@@ -74,8 +103,8 @@ class SchemaField:
         max_length: Optional[int] = None,
         min_value: Optional[Union[int, float]] = None,
         max_value: Optional[Union[int, float]] = None,
-        allowed_values: Optional[List[Any]] = None,
-        pattern: Optional[str] = None,
+        allowed_values: Optional[Iterable[Any]] = None,
+        pattern: Optional[Union[str, re.Pattern]] = None,
         custom_validator: Optional[Callable] = None,
         description: Optional[str] = None,
     ):
@@ -86,15 +115,51 @@ class SchemaField:
         self.max_length       = max_length
         self.min_value        = min_value
         self.max_value        = max_value
-        self.allowed_values   = allowed_values
-        self.pattern          = pattern
+        # Membership is tested per request — use a frozenset (O(1)) when the
+        # field's values are hashable. Messages keep the declared order.
+        if allowed_values is not None:
+            allowed_values = tuple(allowed_values)
+        self.allowed_values: Optional[Collection[Any]]
+        if allowed_values is not None and field_type.__hash__ is not None:
+            self.allowed_values = frozenset(allowed_values)
+        else:
+            self.allowed_values = allowed_values
+        # Accept a pre-compiled pattern so modules can share one Pattern object
+        self._pattern_re      = re.compile(pattern) if pattern is not None else None
+        self.pattern          = self._pattern_re.pattern if self._pattern_re is not None else None
         self.custom_validator = custom_validator
-        self.description      = description
+        self.description      = None if config.SCHEMAS_STRIP_DOCS else description
+
+        # Error-message fragments that depend only on the declaration
+        self._type_name           = field_type.__name__
+        self._allowed_values_text = (
+            ', '.join(map(str, allowed_values)) if allowed_values is not None else None
+        )
+
+        # Rules are fixed at construction, so select the checks that apply once
+        # instead of testing every optional rule on every request.
+        is_string  = issubclass(field_type, str)
+        is_numeric = issubclass(field_type, (int, float)) and field_type is not bool
+        self._checks: List[Callable[[str, Any], None]] = [
+            self._check_exact_type if field_type in _EXACT_TYPES else self._check_type
+        ]
+        if is_string and min_length is not None:
+            self._checks.append(self._check_min_length)
+        if is_string and max_length is not None:
+            self._checks.append(self._check_max_length)
+        if is_numeric and min_value is not None:
+            self._checks.append(self._check_min_value)
+        if is_numeric and max_value is not None:
+            self._checks.append(self._check_max_value)
+        if allowed_values is not None:
+            self._checks.append(self._check_allowed_values)
+        if is_string and pattern is not None:
+            self._checks.append(self._check_pattern)
+        if custom_validator is not None:
+            self._checks.append(self._check_custom)
 
     def validate(self, field_name: str, value: Any) -> None:
         """Validate value against all rules for this field. Raises ValidationError on failure."""
-
-        # Null check
         if value is None:
             if self.nullable:
                 return
@@ -103,74 +168,167 @@ class SchemaField:
                 {field_name: "This field cannot be null"},
             )
 
-        # Type check
-        if not isinstance(value, self.field_type):
+        for check in self._checks:
+            check(field_name, value)
+
+    def _source(self, field_name: str, prefix: str, ns: Dict[str, Any]) -> List[str]:
+        """
+        Emit straight-line source validating this field inside a compiled
+        Schema validator (see Schema.compile). The value is bound to `v`;
+        the first failing rule records its message in `errors`, exactly as
+        validate() would. Objects the code needs are added to ns under prefix.
+        """
+        n = repr(field_name)
+        if self.nullable or not self.required:
+            lines = ["    if v is _MISSING or v is None:", "        pass"]
+        else:
+            lines = [
+                "    if v is _MISSING:",
+                "        pass",
+                "    elif v is None:",
+                f"        errors[{n}] = 'This field cannot be null'",
+            ]
+
+        def fail(condition: str, message: str) -> None:
+            lines.append(f"    elif {condition}:")
+            lines.append(f"        errors[{n}] = {message}")
+
+        ns[f'{prefix}_type'] = self.field_type
+        type_error = repr(f"Expected {self._type_name}, got ") + " + type(v).__name__"
+        if self.field_type in _EXACT_TYPES:
+            fail(f"type(v) is not {prefix}_type", type_error)
+        elif self.field_type is not bool and issubclass(bool, self.field_type):
+            fail(f"not isinstance(v, {prefix}_type) or isinstance(v, bool)", type_error)
+        else:
+            fail(f"not isinstance(v, {prefix}_type)", type_error)
+
+        # Rule values are bound into ns rather than inlined: repr() is not a
+        # valid expression for every bound (float('inf'), Decimal, ...).
+        checks = self._checks
+        if self._check_min_length in checks:
+            ns[f'{prefix}_min_length'] = self.min_length
+            fail(f"len(v) < {prefix}_min_length",
+                 repr(f"Minimum length is {self.min_length} characters"))
+        if self._check_max_length in checks:
+            ns[f'{prefix}_max_length'] = self.max_length
+            fail(f"len(v) > {prefix}_max_length",
+                 repr(f"Maximum length is {self.max_length} characters"))
+        if self._check_min_value in checks:
+            ns[f'{prefix}_min_value'] = self.min_value
+            fail(f"v < {prefix}_min_value", repr(f"Minimum value is {self.min_value}"))
+        if self._check_max_value in checks:
+            ns[f'{prefix}_max_value'] = self.max_value
+            fail(f"v > {prefix}_max_value", repr(f"Maximum value is {self.max_value}"))
+        if self._check_allowed_values in checks:
+            ns[f'{prefix}_allowed'] = self.allowed_values
+            fail(f"v not in {prefix}_allowed",
+                 repr(f"Allowed values: {self._allowed_values_text}"))
+        if self._check_pattern in checks:
+            ns[f'{prefix}_pattern'] = self._pattern_re
+            fail(f"not {prefix}_pattern.fullmatch(v)",
+                 repr(f"Value must match pattern: {self.pattern}"))
+        if self._check_custom in checks:
+            ns[f'{prefix}_custom'] = self._check_custom
+            lines += [
+                "    else:",
+                "        try:",
+                f"            {prefix}_custom({n}, v)",
+                "        except ValidationError as exc:",
+                "            errors.update(exc.details)",
+            ]
+        return lines
+
+    # Individual checks — each raises ValidationError on failure
+
+    def _check_type(self, field_name: str, value: Any) -> None:
+        # bool is a subclass of int, but True is not a valid int field value
+        if not isinstance(value, self.field_type) or (
+            isinstance(value, bool) and self.field_type is not bool
+        ):
             raise ValidationError(
                 f"Invalid type for field '{field_name}'",
-                {field_name: f"Expected {self.field_type.__name__}, got {type(value).__name__}"},
+                {field_name: f"Expected {self._type_name}, got {type(value).__name__}"},
             )
 
-        # String rules
-        if isinstance(value, str):
-            if self.min_length is not None and len(value) < self.min_length:
-                raise ValidationError(
-                    f"Field '{field_name}' is too short",
-                    {field_name: f"Minimum length is {self.min_length} characters"},
-                )
-            if self.max_length is not None and len(value) > self.max_length:
-                raise ValidationError(
-                    f"Field '{field_name}' is too long",
-                    {field_name: f"Maximum length is {self.max_length} characters"},
-                )
+    def _check_exact_type(self, field_name: str, value: Any) -> None:
+        if type(value) is not self.field_type:
+            raise ValidationError(
+                f"Invalid type for field '{field_name}'",
+                {field_name: f"Expected {self._type_name}, got {type(value).__name__}"},
+            )
 
-        # Numeric rules
-        if isinstance(value, (int, float)) and not isinstance(value, bool):
-            if self.min_value is not None and value < self.min_value:
-                raise ValidationError(
-                    f"Field '{field_name}' value is too small",
-                    {field_name: f"Minimum value is {self.min_value}"},
-                )
-            if self.max_value is not None and value > self.max_value:
-                raise ValidationError(
-                    f"Field '{field_name}' value is too large",
-                    {field_name: f"Maximum value is {self.max_value}"},
-                )
+    # Each check is only selected when its rule is set (see __init__); the
+    # asserts narrow the Optional attribute for type checkers.
+
+    def _check_min_length(self, field_name: str, value: str) -> None:
+        assert self.min_length is not None
+        if len(value) < self.min_length:
+            raise ValidationError(
+                f"Field '{field_name}' is too short",
+                {field_name: f"Minimum length is {self.min_length} characters"},
+            )
+
+    def _check_max_length(self, field_name: str, value: str) -> None:
+        assert self.max_length is not None
+        if len(value) > self.max_length:
+            raise ValidationError(
+                f"Field '{field_name}' is too long",
+                {field_name: f"Maximum length is {self.max_length} characters"},
+            )
+
+    def _check_min_value(self, field_name: str, value: Union[int, float]) -> None:
+        assert self.min_value is not None
+        if value < self.min_value:
+            raise ValidationError(
+                f"Field '{field_name}' value is too small",
+                {field_name: f"Minimum value is {self.min_value}"},
+            )
 
-        # Allowed values
-        if self.allowed_values is not None and value not in self.allowed_values:
+    def _check_max_value(self, field_name: str, value: Union[int, float]) -> None:
+        assert self.max_value is not None
+        if value > self.max_value:
+            raise ValidationError(
+                f"Field '{field_name}' value is too large",
+                {field_name: f"Maximum value is {self.max_value}"},
+            )
+
+    def _check_allowed_values(self, field_name: str, value: Any) -> None:
+        assert self.allowed_values is not None
+        if value not in self.allowed_values:
             raise ValidationError(
                 f"Invalid value for field '{field_name}'",
-                {field_name: f"Allowed values: {', '.join(map(str, self.allowed_values))}"},
+                {field_name: f"Allowed values: {self._allowed_values_text}"},
             )
 
-        # Regex pattern
-        if self.pattern is not None and isinstance(value, str):
-            if not re.fullmatch(self.pattern, value):
-                raise ValidationError(
-                    f"Field '{field_name}' does not match required pattern",
-                    {field_name: f"Value must match pattern: {self.pattern}"},
-                )
+    def _check_pattern(self, field_name: str, value: str) -> None:
+        assert self._pattern_re is not None
+        if not self._pattern_re.fullmatch(value):
+            raise ValidationError(
+                f"Field '{field_name}' does not match required pattern",
+                {field_name: f"Value must match pattern: {self.pattern}"},
+            )
 
-        # Custom validator — accepts both (bool, str) tuples and raised exceptions
-        if self.custom_validator is not None:
-            try:
-                result = self.custom_validator(value)
-            except ValidationError:
-                raise
-            except Exception as exc:
+    def _check_custom(self, field_name: str, value: Any) -> None:
+        # Accepts both (bool, str) tuples and raised exceptions
+        assert self.custom_validator is not None
+        try:
+            result = self.custom_validator(value)
+        except ValidationError:
+            raise
+        except Exception as exc:
+            raise ValidationError(
+                f"Validation failed for '{field_name}'",
+                {field_name: str(exc)},
+            ) from exc
+
+        # Handle (bool, str | None) return style
+        if isinstance(result, tuple):
+            is_valid, error_msg = result
+            if not is_valid:
                 raise ValidationError(
                     f"Validation failed for '{field_name}'",
-                    {field_name: str(exc)},
-                ) from exc
-
-            # Handle (bool, str | None) return style
-            if isinstance(result, tuple):
-                is_valid, error_msg = result
-                if not is_valid:
-                    raise ValidationError(
-                        f"Validation failed for '{field_name}'",
-                        {field_name: error_msg or f"Invalid value for {field_name}"},
-                    )
+                    {field_name: error_msg or f"Invalid value for {field_name}"},
+                )
 
 
 # ---------------------------------------------------------------------------
@@ -190,6 +348,11 @@ class Schema:
                             ValidationError if the combination is invalid
     """
 
+    __slots__ = (
+        'fields', 'strict', 'cross_field_validators', '_required', '_optional',
+        '_allowed_keys', '_compiled', '_source',
+    )
+
     def __init__(
         self,
         fields: Dict[str, SchemaField],
@@ -199,6 +362,49 @@ class Schema:
         self.fields                 = fields
         self.strict                 = strict
         self.cross_field_validators = cross_field_validators or []
+        # Split once so validation walks each group without a per-field branch
+        self._required: Tuple[Tuple[str, SchemaField], ...] = tuple(
+            (name, field) for name, field in fields.items() if field.required
+        )
+        self._optional: Tuple[Tuple[str, SchemaField], ...] = tuple(
+            (name, field) for name, field in fields.items() if not field.required
+        )
+        self._allowed_keys          = frozenset(fields)
+        self._compiled: Optional[Callable[[Dict[str, Any]], Dict[str, str]]] = None
+        self._source: Optional[str] = None
+
+    def compile(self) -> "Schema":
+        """
+        Generate a straight-line validator for this schema's fields and use it
+        in place of the generic field walk. Every rule is inlined as a literal
+        comparison; only custom validators remain calls. Produces exactly the
+        same errors as the uncompiled path. Returns self.
+        """
+        ns: Dict[str, Any] = {
+            'ValidationError': ValidationError,
+            '_MISSING':        _MISSING,
+            '_allowed_keys':   self._allowed_keys,
+        }
+        lines = ["def _validate_fields(data):", "    errors = {}"]
+        for name, _ in self._required:
+            lines += [
+                f"    if {name!r} not in data:",
+                f"        errors[{name!r}] = 'This field is required'",
+            ]
+        if self.strict:
+            lines += [
+                "    for name in data.keys() - _allowed_keys:",
+                "        errors[name] = 'This field is not allowed'",
+            ]
+        for index, (name, field) in enumerate(self.fields.items()):
+            lines.append(f"    v = data.get({name!r}, _MISSING)")
+            lines += field._source(name, f'_f{index}', ns)
+        lines.append("    return errors")
+
+        self._source = "\n".join(lines) + "\n"
+        exec(compile(self._source, f"<schema {id(self):#x}>", "exec"), ns)
+        self._compiled = ns['_validate_fields']
+        return self
 
     def validate(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -213,70 +419,165 @@ class Schema:
                 {"body": f"Expected object, got {type(data).__name__}"},
             )
 
-        errors: Dict[str, str] = {}
+        if self._compiled is not None:
+            errors = self._compiled(data)
+        else:
+            errors = self._validate_fields(data)
 
-        # Missing required fields
-        for field_name, field_schema in self.fields.items():
-            if field_schema.required and field_name not in data:
-                errors[field_name] = "This field is required"
+        if errors:
+            raise ValidationError("Validation failed", errors)
 
-        # Unknown fields (strict mode)
-        if self.strict:
-            for field_name in data:
-                if field_name not in self.fields:
-                    errors[field_name] = "This field is not allowed"
+        # Cross-field validation (only runs when per-field passes)
+        for validator in self.cross_field_validators:
+            try:
+                validator(data)
+            except ValidationError as exc:
+                raise ValidationError(exc.message, exc.details) from exc
 
-        # Per-field validation (only for fields that are present)
-        for field_name, value in data.items():
-            if field_name not in self.fields:
-                continue
-            field_schema = self.fields[field_name]
+        return data
+
+    def validate_many(self, bodies: Iterable[Any]) -> List[Optional[ValidationError]]:
+        """
+        Validate a batch of bodies (e.g. a bulk import) against this schema.
+        Returns one entry per body, in order: None if it is valid, otherwise
+        the ValidationError validate() would have raised for it.
+        """
+        validate = self.validate
+        results: List[Optional[ValidationError]] = []
+        for body in bodies:
+            try:
+                validate(body)
+                results.append(None)
+            except ValidationError as exc:
+                results.append(exc)
+        return results
+
+    def _validate_fields(self, data: Dict[str, Any]) -> Dict[str, str]:
+        """Generic per-field walk used until compile() is called. Returns field → error."""
+        errors: Dict[str, str] = {}
 
-            # Skip custom/type checks when field is absent-but-optional (already handled above)
-            if value is None and not field_schema.nullable and not field_schema.required:
+        # Required fields must be present; every present one is validated
+        for field_name, field_schema in self._required:
+            if field_name not in data:
+                errors[field_name] = "This field is required"
                 continue
+            try:
+                field_schema.validate(field_name, data[field_name])
+            except ValidationError as exc:
+                errors.update(exc.details)
 
+        # Optional fields are validated only when present and not a bare null
+        for field_name, field_schema in self._optional:
+            value = data.get(field_name)
+            if value is None and not field_schema.nullable:
+                continue
             try:
                 field_schema.validate(field_name, value)
             except ValidationError as exc:
                 errors.update(exc.details)
 
-        if errors:
-            raise ValidationError("Validation failed", errors)
+        # Unknown fields (strict mode)
+        if self.strict:
+            for field_name in data.keys() - self._allowed_keys:
+                errors[field_name] = "This field is not allowed"
 
-        # Cross-field validation (only runs when per-field passes)
-        for validator in self.cross_field_validators:
-            try:
-                validator(data)
-            except ValidationError as exc:
-                raise ValidationError(exc.message, exc.details) from exc
+        return errors
 
-        return data
+
+class StrictSchema(Schema):
+    """
+    A Schema that always rejects unknown fields. Every API body schema is
+    strict, so they are declared with this class rather than strict=True;
+    the generated validator always emits the unknown-key check, right after
+    the required-field presence checks.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        fields: Dict[str, SchemaField],
+        cross_field_validators: Optional[List[Callable[[Dict], None]]] = None,
+    ):
+        super().__init__(fields, strict=True, cross_field_validators=cross_field_validators)
+
+
+# ---------------------------------------------------------------------------
+# Validation result cache
+# ---------------------------------------------------------------------------
+# (schema, blake2b(raw body)) → (expires_at, None | (message, details))
+# Keyed on the Schema object itself: schemas whose custom validators differ
+# only by closure or lambda body have no content identity to key on.
+# Validators may read app settings live (e.g. the password minimum length),
+# so app_settings calls clear_validation_cache() whenever settings are
+# written or reloaded; a verdict never outlives the settings it was made under.
+
+_VALIDATION_CACHE_SIZE = 4096
+_VALIDATION_CACHE_TTL  = 60  # seconds
+_validation_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_VALID = None
+
+# Lambda handler signature: (event, context) → {statusCode, body}
+Handler = Callable[[Dict[str, Any], Any], Dict[str, Any]]
+
+
+def clear_validation_cache() -> None:
+    """Drop every cached verdict (called by app_settings on settings changes)."""
+    _validation_cache.clear()
+
+
+def _validation_cache_key(schema: Schema, raw_body: str) -> tuple:
+    return schema, hashlib.blake2b(raw_body.encode('utf-8'), digest_size=16).digest()
+
+
+def _validate_cached(
+    schema: Schema, key: Optional[tuple], body: Any
+) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """Return None if body is valid, else (message, details). Uses/fills the cache when key is given."""
+    if key is not None:
+        entry = _validation_cache.get(key)
+        if entry is not None and time.time() < entry[0]:
+            _validation_cache.move_to_end(key)
+            return entry[1]
+
+    try:
+        schema.validate(body)
+        verdict = _VALID
+    except ValidationError as exc:
+        verdict = (exc.message, exc.details)
+
+    if key is not None:
+        _validation_cache[key] = (time.time() + _VALIDATION_CACHE_TTL, verdict)
+        _validation_cache.move_to_end(key)
+        if len(_validation_cache) > _VALIDATION_CACHE_SIZE:
+            _validation_cache.popitem(last=False)
+    return verdict
 
 
 # ---------------------------------------------------------------------------
 # Decorator
 # ---------------------------------------------------------------------------
 
-def validate_request_body(schema: Schema):
+def validate_request_body(schema: Schema) -> Callable[[Handler], Handler]:
     """
     Decorator: parse and validate the request body before the handler runs.
 
+    The parsed body is stored on event['_parsed_body'] so the handler does
+    not parse the same JSON a second time.
+
     Usage
     -----
         @validate_request_body(registration_schema)
         def register(event, context):
-            body = json.loads(event['body'])   # already validated
+            body = get_request_body(event)   # already parsed and validated
             ...
     """
-    import json
-    from functools import wraps
-
-    def decorator(func):
+    def decorator(func: Handler) -> Handler:
         @wraps(func)
-        def wrapper(event, context):
+        def wrapper(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+            raw_body = event.get('body') or '{}'
             try:
-                body = json.loads(event.get('body') or '{}')
+                body = json.loads(raw_body)
             except json.JSONDecodeError:
                 return error_response(
                     "Invalid JSON in request body",
@@ -284,17 +585,30 @@ def validate_request_body(schema: Schema):
                     error_code="INVALID_JSON",
                 )
 
-            try:
-                schema.validate(body)
-            except ValidationError as exc:
+            key = _validation_cache_key(schema, raw_body) if isinstance(raw_body, str) else None
+            verdict = _validate_cached(schema, key, body)
+            if verdict is not _VALID:
+                message, details = verdict
                 return error_response(
-                    exc.message,
+                    message,
                     status_code=422,
                     error_code="VALIDATION_ERROR",
-                    error_details=exc.details,
+                    error_details=details,
                 )
 
+            event['_parsed_body'] = body
             return func(event, context)
 
         return wrapper
     return decorator
+
+
+def get_request_body(event: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return the request body parsed by @validate_request_body.
+    Falls back to parsing event['body'] when the decorator did not run.
+    """
+    body = event.get('_parsed_body')
+    if body is None:
+        body = json.loads(event.get('body') or '{}')
+    return body
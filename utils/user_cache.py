@@ -0,0 +1,74 @@
+"""
+Short-lived in-process cache for user lookups by email.
+
+Under credential-stuffing, the same account is hit many times per second;
+caching the user record for a few seconds collapses those GSI queries into
+one read. Whenever UserDB mutates a user, the entry is patched with the
+written values (or dropped), so the container that made a change never
+serves a stale record. Other warm containers may serve one for at most the
+TTL.
+"""
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+class UserCache:
+    """Bounded TTL cache of user records keyed by email, invalidated by user_id."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 5.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # email → (expires_at, user)
+        self._entries: Dict[str, tuple[float, Dict[str, Any]]] = {}
+        # user_id → email, so mutations keyed by user_id can find the entry
+        self._emails: Dict[str, str] = {}
+
+    def get(self, email: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached user, or None on miss/expiry."""
+        with self._lock:
+            entry = self._entries.get(email)
+            if entry is None:
+                return None
+            expires_at, user = entry
+            if time.time() >= expires_at:
+                self._remove(email)
+                return None
+            return dict(user)
+
+    def put(self, email: str, user: Dict[str, Any]) -> None:
+        with self._lock:
+            self._remove(email)
+            # Drop the entry under the user's previous email (e.g. after an
+            # email change), or invalidate(user_id) would no longer reach it
+            previous_email = self._emails.get(user['user_id'])
+            if previous_email is not None:
+                self._remove(previous_email)
+            self._entries[email] = (time.time() + self.ttl, dict(user))
+            self._emails[user['user_id']] = email
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+
+    def update(self, user_id: str, changes: Dict[str, Any]) -> None:
+        """Apply attributes just written to DynamoDB to the cached user, if any."""
+        with self._lock:
+            email = self._emails.get(user_id)
+            if email is not None:
+                self._entries[email][1].update(changes)
+
+    def invalidate(self, user_id: str) -> None:
+        with self._lock:
+            email = self._emails.get(user_id)
+            if email is not None:
+                self._remove(email)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._emails.clear()
+
+    def _remove(self, email: str) -> None:
+        entry = self._entries.pop(email, None)
+        if entry is not None:
+            self._emails.pop(entry[1]['user_id'], None)
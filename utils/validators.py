@@ -31,6 +31,9 @@ def validate_password(password: str) -> tuple[bool, Optional[str]]:
     if not password:
         return False, "Password is required"
 
+    # Not memoized: this is one len() against the live setting, cheaper than
+    # hashing the password for a cache key. The schema verdict cache does
+    # cover repeated bodies, and is cleared whenever settings change.
     min_password_length = get_setting('min_password_length', config.MIN_PASSWORD_LENGTH)
 
     if len(password) < min_password_length:
@@ -94,7 +97,7 @@ def validate_registration_data(data: Dict) -> tuple[bool, Optional[Dict]]:
     Email or phone (at least one) is required.
     Returns (is_valid, errors_dict)
     """
-    errors = {}
+    errors: Dict[str, Optional[str]] = {}
 
     email = data.get('email', '').strip() if data.get('email') else None
     phone = data.get('phone', '').strip() if data.get('phone') else None
@@ -133,7 +136,7 @@ def validate_login_data(data: Dict) -> tuple[bool, Optional[Dict]]:
     Email or phone (at least one) is required.
     Returns (is_valid, errors_dict)
     """
-    errors = {}
+    errors: Dict[str, Optional[str]] = {}
 
     email = data.get('email', '').strip() if data.get('email') else None
     phone = data.get('phone', '').strip() if data.get('phone') else None